@@ -2,8 +2,23 @@ from fastapi import Depends
 from database import get_session
 from sqlmodel import Session
 from app.services.user_service import UserService
+from app.services.execution_service import ExecutionService
+from app.services.workflow_service import WorkflowService
 from app.repository.user_repository import UserRepository
+from app.repository.execution_repository import ExecutionRepository
+from app.repository.workflow_repository import WorkflowRepository
 
 def get_user_service(session: Session = Depends(get_session)) -> UserService:
     repo = UserRepository(session)
-    return UserService(repo)
\ No newline at end of file
+    return UserService(repo)
+
+def get_execution_service(session: Session = Depends(get_session)) -> ExecutionService:
+    repo = ExecutionRepository(session)
+    return ExecutionService(repo)
+
+def get_workflow_repository(session: Session = Depends(get_session)) -> WorkflowRepository:
+    return WorkflowRepository(session)
+
+def get_workflow_service(session: Session = Depends(get_session)) -> WorkflowService:
+    repo = WorkflowRepository(session)
+    return WorkflowService(repo)
@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Annotated
+from app.models.user import User
+from app.models.workflow import Workflow
+from app.schemas.execution import ExecutionPage, ExecutionRollupRead
+from app.services.auth import get_current_active_user
+from app.services.execution_service import ExecutionService, InvalidCursorError
+from app.repository.workflow_repository import WorkflowRepository
+from app.api.dependencies import get_execution_service, get_workflow_repository
+import uuid
+
+router = APIRouter(
+    prefix="/workflows",
+    tags=["executions"],
+)
+
+def get_owned_workflow(
+    workflow_id: uuid.UUID,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    workflow_repo: WorkflowRepository = Depends(get_workflow_repository),
+) -> Workflow:
+    workflow = workflow_repo.get_workflow_by_id(workflow_id)
+    if workflow is None or workflow.user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workflow not found")
+    return workflow
+
+# Plain def: the sync queries run in the threadpool, not on the event loop.
+@router.get("/{workflow_id}/executions/", response_model=ExecutionPage)
+def list_executions(
+    workflow: Annotated[Workflow, Depends(get_owned_workflow)],
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: str | None = None,
+    execution_service: ExecutionService = Depends(get_execution_service),
+):
+    try:
+        return execution_service.list_executions(workflow.id, limit=limit, cursor=cursor)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+@router.get("/{workflow_id}/executions/rollups/", response_model=list[ExecutionRollupRead])
+def list_execution_rollups(
+    workflow: Annotated[Workflow, Depends(get_owned_workflow)],
+    days: Annotated[int, Query(ge=1, le=366)] = 30,
+    execution_service: ExecutionService = Depends(get_execution_service),
+):
+    return execution_service.get_daily_rollups(workflow.id, days=days)
@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from typing import Annotated
+from app.models.user import User
+from app.schemas.workflow import WorkflowImport, WorkflowImportResult
+from app.services.auth import get_current_active_user
+from app.services.workflow_service import WorkflowConflictError, WorkflowService
+from app.api.dependencies import get_workflow_service
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+router = APIRouter(
+    prefix="/workflows",
+    tags=["workflows"],
+)
+
+_workflow_list = TypeAdapter(list[WorkflowImport])
+
+def parse_workflow_import(body: bytes, content_type: str) -> list[WorkflowImport]:
+    """
+    Accept either a JSON array or NDJSON (one workflow per line). Errors from
+    the NDJSON path carry the 1-based line number.
+    """
+    if content_type.startswith("application/json"):
+        return _workflow_list.validate_json(body)
+    items = []
+    for line_no, line in enumerate(body.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            items.append(WorkflowImport.model_validate_json(line))
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=[{"line": line_no, **err} for err in e.errors(include_url=False, include_input=False)],
+            )
+    return items
+
+async def read_body(request: Request) -> bytes:
+    return await request.body()
+
+# Plain def: parsing and the batched inserts run in the threadpool, not on the event loop.
+@router.post("/import/", response_model=WorkflowImportResult, status_code=status.HTTP_201_CREATED)
+def import_workflows(
+    request: Request,
+    body: Annotated[bytes, Depends(read_body)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    workflow_service: WorkflowService = Depends(get_workflow_service),
+):
+    try:
+        items = parse_workflow_import(body, request.headers.get("content-type", NDJSON_MEDIA_TYPE))
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_input=False),
+        )
+    try:
+        return workflow_service.import_workflows(current_user.id, items)
+    except WorkflowConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), "names": e.names, "unavailable": e.unavailable},
+        )
+
+@router.get("/export/")
+async def export_workflows(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    workflow_service: WorkflowService = Depends(get_workflow_service),
+):
+    return StreamingResponse(
+        workflow_service.export_workflows_ndjson(current_user.id),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
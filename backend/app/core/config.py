@@ -1,21 +1,26 @@
 import os
-from dotenv import load_dotenv
-
+from functools import lru_cache
 from pathlib import Path
-env_path = Path(".") / ".env"
-load_dotenv(dotenv_path=env_path)
 
 class Settings:
-    POSTGRES_USER : str = os.getenv("POSTGRES_USER")
-    POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD")
-    POSTGRES_HOST : str = os.getenv("POSTGRES_HOST","db")
-    POSTGRES_PORT : str = os.getenv("POSTGRES_PORT",5432)
-    POSTGRES_DB : str = os.getenv("POSTGRES_DB")
-    DATABASE_URL: str = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
-    ALGORITHM: str = os.getenv("ALGORITHM")
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
-    SECRET_KEY:str = os.getenv("SECRET_KEY") 
+    def __init__(self):
+        self.POSTGRES_USER: str = os.getenv("POSTGRES_USER")
+        self.POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD")
+        self.POSTGRES_HOST: str = os.getenv("POSTGRES_HOST", "db")
+        self.POSTGRES_PORT: str = os.getenv("POSTGRES_PORT", 5432)
+        self.POSTGRES_DB: str = os.getenv("POSTGRES_DB")
+        # DATABASE_URL overrides the Postgres settings, e.g. sqlite:///load.db for the load-test harness.
+        self.DATABASE_URL: str = os.getenv("DATABASE_URL") or f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        self.SQL_ECHO: bool = os.getenv("SQL_ECHO", "true").lower() == "true"
+        self.ALGORITHM: str = os.getenv("ALGORITHM")
+        self.ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
+        self.SECRET_KEY: str = os.getenv("SECRET_KEY")
+
 
+@lru_cache
+def get_settings() -> Settings:
+    """Load .env and build settings on first use instead of at import time."""
+    from dotenv import load_dotenv
 
-settings = Settings()
-print(settings.DATABASE_URL)
\ No newline at end of file
+    load_dotenv(dotenv_path=Path(".") / ".env")
+    return Settings()
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from datetime import datetime
 from typing import Optional
 from enum import Enum
@@ -12,9 +13,13 @@ class StatusEnum(str, Enum):
 
 class Execution(SQLModel, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, index=True)
-    workflow_id: uuid.UUID = Field(foreign_key="Workflows.id", nullable=False, index=True)
+    # Covered by the (workflow_id, started_at, id) index below, which also serves keyset pagination.
+    workflow_id: uuid.UUID = Field(foreign_key="Workflows.id", nullable=False)
     status: StatusEnum = Field(index=True, default=StatusEnum.PENDING, nullable=False)
     started_at: datetime = Field(default_factory=datetime.now, nullable=False)
     completed_at: Optional[datetime] = Field(default=None, nullable=True)
     log: Optional[str] = Field(default=None, nullable=True)
-    __tablename__ = "Executions"
\ No newline at end of file
+    __tablename__ = "Executions"
+    __table_args__ = (
+        Index("ix_Executions_workflow_id_started_at_id", "workflow_id", "started_at", "id"),
+    )
@@ -0,0 +1,26 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import UniqueConstraint
+from datetime import date, datetime
+from typing import Optional
+import uuid
+
+class ExecutionRollup(SQLModel, table=True):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, index=True)
+    workflow_id: uuid.UUID = Field(foreign_key="Workflows.id", nullable=False)
+    day: date = Field(nullable=False)
+    total: int = Field(default=0, nullable=False)
+    completed: int = Field(default=0, nullable=False)
+    failed: int = Field(default=0, nullable=False)
+    # JSON list of counts per duration bucket, see app.services.execution_service.
+    duration_histogram: str = Field(default="[]", nullable=False)
+    min_duration_ms: Optional[int] = Field(default=None, nullable=True)
+    max_duration_ms: Optional[int] = Field(default=None, nullable=True)
+    # Estimated by interpolating within the histogram bucket, clamped to min/max.
+    p50_duration_ms: Optional[int] = Field(default=None, nullable=True)
+    p95_duration_ms: Optional[int] = Field(default=None, nullable=True)
+    updated_at: datetime = Field(default_factory=datetime.now, nullable=False)
+
+    __tablename__ = "ExecutionRollups"
+    __table_args__ = (
+        UniqueConstraint("workflow_id", "day", name="uq_ExecutionRollups_workflow_id_day"),
+    )
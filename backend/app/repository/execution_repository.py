@@ -0,0 +1,76 @@
+from datetime import date, datetime
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+from app.models.execution import Execution
+from app.models.execution_rollup import ExecutionRollup
+import sqlmodel
+import uuid
+
+class ExecutionRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def create_execution(self, execution: Execution) -> Execution:
+        self.session.add(execution)
+        self.session.commit()
+        self.session.refresh(execution)
+        return execution
+
+    def get_execution_by_id(self, execution_id: uuid.UUID, for_update: bool = False) -> Execution | None:
+        q = sqlmodel.select(Execution).where(Execution.id == execution_id)
+        if for_update:
+            q = q.with_for_update()
+        result = self.session.execute(q)
+        return result.scalar_one_or_none()
+
+    def list_execution_summaries(
+            self,
+            workflow_id: uuid.UUID,
+            limit: int,
+            after: tuple[datetime, uuid.UUID] | None = None,
+    ) -> list:
+        """
+        Newest first, keyset-paginated on (started_at, id) so every page is an
+        index range scan on (workflow_id, started_at, id). The log column is never loaded.
+        """
+        q = (
+            sqlmodel.select(
+                Execution.id,
+                Execution.workflow_id,
+                Execution.status,
+                Execution.started_at,
+                Execution.completed_at,
+            )
+            .where(Execution.workflow_id == workflow_id)
+            .order_by(Execution.started_at.desc(), Execution.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            q = q.where(tuple_(Execution.started_at, Execution.id) < tuple_(*after))
+        return list(self.session.execute(q).all())
+
+    def get_rollup(self, workflow_id: uuid.UUID, day: date, for_update: bool = False) -> ExecutionRollup | None:
+        q = sqlmodel.select(ExecutionRollup).where(
+            ExecutionRollup.workflow_id == workflow_id,
+            ExecutionRollup.day == day,
+        )
+        if for_update:
+            q = q.with_for_update()
+        result = self.session.execute(q)
+        return result.scalar_one_or_none()
+
+    def list_rollups(self, workflow_id: uuid.UUID, since: date) -> list[ExecutionRollup]:
+        q = (
+            sqlmodel.select(ExecutionRollup)
+            .where(ExecutionRollup.workflow_id == workflow_id, ExecutionRollup.day >= since)
+            .order_by(ExecutionRollup.day.desc())
+        )
+        return list(self.session.execute(q).scalars().all())
+
+    def complete_execution(self, execution: Execution, rollup: ExecutionRollup) -> Execution:
+        """Persist a finished execution together with its rollup in a single transaction."""
+        self.session.add(execution)
+        self.session.add(rollup)
+        self.session.commit()
+        self.session.refresh(execution)
+        return execution
@@ -0,0 +1,75 @@
+from collections import defaultdict
+from typing import Iterator
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.models.workflow import Workflow
+from app.models.workflow_steps import WorkflowSteps
+import sqlmodel
+import uuid
+
+# Rows per executemany round trip; also bounds the size of IN (...) lists.
+BATCH_SIZE = 1000
+
+class WorkflowRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_workflow_by_id(self, workflow_id: uuid.UUID) -> Workflow | None:
+        q = sqlmodel.select(Workflow).where(Workflow.id == workflow_id)
+        result = self.session.execute(q)
+        return result.scalar_one_or_none()
+
+    def get_name_owners(self, names: list[str]) -> dict[str, uuid.UUID]:
+        """Map each of `names` that is already taken to the id of the user owning it."""
+        owners = {}
+        for i in range(0, len(names), BATCH_SIZE):
+            q = sqlmodel.select(Workflow.name, Workflow.user_id).where(Workflow.name.in_(names[i:i + BATCH_SIZE]))
+            owners.update(self.session.execute(q).tuples().all())
+        return owners
+
+    def bulk_create_workflows(self, workflows: list[dict], steps: list[dict]) -> None:
+        """
+        Insert plain row dicts with batched executemany statements and a single
+        commit, bypassing the ORM unit of work. Rows must carry every column
+        value, including ids and timestamps.
+        """
+        try:
+            for i in range(0, len(workflows), BATCH_SIZE):
+                self.session.execute(insert(Workflow), workflows[i:i + BATCH_SIZE])
+            for i in range(0, len(steps), BATCH_SIZE):
+                self.session.execute(insert(WorkflowSteps), steps[i:i + BATCH_SIZE])
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+    def iter_workflows_with_steps(self, user_id: uuid.UUID) -> Iterator[tuple[Workflow, list[WorkflowSteps]]]:
+        """Walk a user's workflows by id in batches, loading each batch's steps with one query."""
+        last_id = None
+        while True:
+            q = (
+                sqlmodel.select(Workflow)
+                .where(Workflow.user_id == user_id)
+                .order_by(Workflow.id)
+                .limit(BATCH_SIZE)
+            )
+            if last_id is not None:
+                q = q.where(Workflow.id > last_id)
+            workflows = list(self.session.execute(q).scalars().all())
+            if not workflows:
+                return
+
+            steps_q = (
+                sqlmodel.select(WorkflowSteps)
+                .where(WorkflowSteps.workflow_id.in_([w.id for w in workflows]))
+                .order_by(WorkflowSteps.workflow_id, WorkflowSteps.step_order)
+            )
+            steps_by_workflow = defaultdict(list)
+            for step in self.session.execute(steps_q).scalars():
+                steps_by_workflow[step.workflow_id].append(step)
+
+            for workflow in workflows:
+                yield workflow, steps_by_workflow[workflow.id]
+            # Keep the identity map from growing with the whole export.
+            self.session.expunge_all()
+            last_id = workflows[-1].id
@@ -0,0 +1,26 @@
+from datetime import date, datetime
+from pydantic import BaseModel
+from app.models.execution import StatusEnum
+import uuid
+
+class ExecutionSummary(BaseModel):
+    id: uuid.UUID
+    workflow_id: uuid.UUID
+    status: StatusEnum
+    started_at: datetime
+    completed_at: datetime | None = None
+
+class ExecutionPage(BaseModel):
+    items: list[ExecutionSummary]
+    next_cursor: str | None = None
+
+class ExecutionRollupRead(BaseModel):
+    workflow_id: uuid.UUID
+    day: date
+    total: int
+    completed: int
+    failed: int
+    min_duration_ms: int | None = None
+    max_duration_ms: int | None = None
+    p50_duration_ms: int | None = None
+    p95_duration_ms: int | None = None
@@ -0,0 +1,24 @@
+from datetime import datetime
+from pydantic import BaseModel
+import uuid
+
+class WorkflowStepData(BaseModel):
+    step_order: int
+    service: str
+    action: str
+    config: str | None = None
+
+class WorkflowImport(BaseModel):
+    name: str
+    description: str | None = None
+    is_active: bool = True
+    steps: list[WorkflowStepData] = []
+
+class WorkflowExport(WorkflowImport):
+    id: uuid.UUID
+    created_at: datetime
+    updated_at: datetime
+
+class WorkflowImportResult(BaseModel):
+    workflows: int
+    steps: int
@@ -3,15 +3,13 @@ from fastapi import Depends, HTTPException, status
 from typing import Annotated
 from jwt.exceptions import InvalidTokenError
 from fastapi.security import OAuth2PasswordBearer
-from app.core.config import settings
-from passlib.context import CryptContext
+from app.core.config import get_settings
 from app.schemas.token import TokenData
 from app.services.user_service import UserService
 from app.api.dependencies import get_user_service
 from app.models.user import User
 import jwt
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 def authenticate_user(
@@ -35,6 +33,7 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    settings = get_settings()
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         username = payload.get("sub")
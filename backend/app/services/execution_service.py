@@ -0,0 +1,124 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime, timedelta
+from bisect import bisect_left
+from sqlalchemy.exc import IntegrityError
+from app.repository.execution_repository import ExecutionRepository
+from app.models.execution import Execution, StatusEnum
+from app.models.execution_rollup import ExecutionRollup
+from app.schemas.execution import ExecutionPage, ExecutionRollupRead, ExecutionSummary
+import json
+import uuid
+
+# Upper bounds (ms) of the duration buckets kept per rollup; the last bucket is open-ended.
+DURATION_BUCKETS_MS = (50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 30_000, 60_000, 300_000, 900_000, 3_600_000)
+FINISHED_STATUSES = (StatusEnum.COMPLETED, StatusEnum.FAILED)
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(started_at: datetime, execution_id: uuid.UUID) -> str:
+    raw = f"{started_at.isoformat()}|{execution_id}".encode()
+    return urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        started_at, execution_id = raw.split("|")
+        return datetime.fromisoformat(started_at), uuid.UUID(execution_id)
+    except ValueError as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def _percentile(histogram: list[int], q: float, min_ms: int, max_ms: int) -> int | None:
+    """
+    Estimate a percentile by linear interpolation inside the bucket holding the
+    rank. Bucket edges are clamped to the observed min/max, so a single run, or
+    runs all in one bucket, report their real duration range.
+    """
+    total = sum(histogram)
+    if total == 0:
+        return None
+    rank = q * total
+    seen = 0
+    for i, count in enumerate(histogram):
+        if count and seen + count >= rank:
+            lower = DURATION_BUCKETS_MS[i - 1] if i > 0 else 0
+            upper = DURATION_BUCKETS_MS[i] if i < len(DURATION_BUCKETS_MS) else max_ms
+            lower, upper = max(lower, min_ms), min(upper, max_ms)
+            return round(lower + (upper - lower) * (rank - seen) / count)
+        seen += count
+    return max_ms
+
+
+def apply_to_rollup(rollup: ExecutionRollup, status: StatusEnum, duration_ms: int) -> ExecutionRollup:
+    """Fold one finished execution into its daily rollup without rescanning Executions."""
+    histogram = json.loads(rollup.duration_histogram) or [0] * (len(DURATION_BUCKETS_MS) + 1)
+    histogram[bisect_left(DURATION_BUCKETS_MS, duration_ms)] += 1
+
+    rollup.min_duration_ms = duration_ms if rollup.min_duration_ms is None else min(rollup.min_duration_ms, duration_ms)
+    rollup.max_duration_ms = duration_ms if rollup.max_duration_ms is None else max(rollup.max_duration_ms, duration_ms)
+    rollup.total += 1
+    if status == StatusEnum.COMPLETED:
+        rollup.completed += 1
+    else:
+        rollup.failed += 1
+    rollup.duration_histogram = json.dumps(histogram)
+    rollup.p50_duration_ms = _percentile(histogram, 0.50, rollup.min_duration_ms, rollup.max_duration_ms)
+    rollup.p95_duration_ms = _percentile(histogram, 0.95, rollup.min_duration_ms, rollup.max_duration_ms)
+    rollup.updated_at = datetime.now()
+    return rollup
+
+
+class ExecutionService:
+    def __init__(self, execution_repo: ExecutionRepository):
+        self.execution_repo = execution_repo
+
+    def start_execution(self, workflow_id: uuid.UUID) -> Execution:
+        execution = Execution(workflow_id=workflow_id, status=StatusEnum.IN_PROGRESS)
+        return self.execution_repo.create_execution(execution)
+
+    def finish_execution(self, execution_id: uuid.UUID, status: StatusEnum, log: str | None = None) -> Execution | None:
+        if status not in FINISHED_STATUSES:
+            raise ValueError(f"Status must be one of {[s.value for s in FINISHED_STATUSES]}")
+        try:
+            return self._finish_execution(execution_id, status, log)
+        except IntegrityError:
+            # Another run created today's rollup row first; retry against it.
+            self.execution_repo.session.rollback()
+            return self._finish_execution(execution_id, status, log)
+
+    def _finish_execution(self, execution_id: uuid.UUID, status: StatusEnum, log: str | None) -> Execution | None:
+        execution = self.execution_repo.get_execution_by_id(execution_id, for_update=True)
+        if execution is None or execution.status in FINISHED_STATUSES:
+            return execution
+
+        execution.status = status
+        execution.completed_at = datetime.now()
+        execution.log = log
+        duration_ms = int((execution.completed_at - execution.started_at).total_seconds() * 1000)
+
+        day = execution.started_at.date()
+        rollup = self.execution_repo.get_rollup(execution.workflow_id, day, for_update=True)
+        if rollup is None:
+            rollup = ExecutionRollup(workflow_id=execution.workflow_id, day=day)
+        apply_to_rollup(rollup, status, duration_ms)
+        return self.execution_repo.complete_execution(execution, rollup)
+
+    def list_executions(self, workflow_id: uuid.UUID, limit: int, cursor: str | None = None) -> ExecutionPage:
+        after = decode_cursor(cursor) if cursor else None
+        # Fetch one extra row to know whether there is a next page.
+        rows = self.execution_repo.list_execution_summaries(workflow_id, limit + 1, after)
+        items = [ExecutionSummary.model_validate(row._mapping) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = encode_cursor(last.started_at, last.id)
+        return ExecutionPage(items=items, next_cursor=next_cursor)
+
+    def get_daily_rollups(self, workflow_id: uuid.UUID, days: int) -> list[ExecutionRollupRead]:
+        since = date.today() - timedelta(days=days - 1)
+        rollups = self.execution_repo.list_rollups(workflow_id, since)
+        return [ExecutionRollupRead.model_validate(r, from_attributes=True) for r in rollups]
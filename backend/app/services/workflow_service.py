@@ -0,0 +1,91 @@
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, Iterator
+from sqlalchemy.exc import IntegrityError
+from app.repository.workflow_repository import WorkflowRepository
+from app.schemas.workflow import WorkflowExport, WorkflowImport, WorkflowImportResult, WorkflowStepData
+import uuid
+
+
+class WorkflowConflictError(ValueError):
+    """
+    `names` lists only conflicts the importing user may see: duplicates within
+    the import and names they already own. Names taken by other users are only
+    counted in `unavailable`.
+    """
+    def __init__(self, names: list[str], unavailable: int = 0):
+        parts = []
+        if names:
+            parts.append(f"Workflow names already exist: {', '.join(names)}")
+        if unavailable:
+            parts.append(f"{unavailable} workflow name(s) unavailable")
+        super().__init__("; ".join(parts))
+        self.names = names
+        self.unavailable = unavailable
+
+
+class WorkflowService:
+    def __init__(self, workflow_repo: WorkflowRepository):
+        self.workflow_repo = workflow_repo
+
+    def import_workflows(self, user_id: uuid.UUID, items: Iterable[WorkflowImport]) -> WorkflowImportResult:
+        """Create all workflows and their steps in one transaction, or none of them."""
+        items = list(items)
+        names = [item.name for item in items]
+        duplicates = {name for name, count in Counter(names).items() if count > 1}
+        if duplicates:
+            raise WorkflowConflictError(sorted(duplicates))
+        self._check_name_owners(user_id, names)
+
+        now = datetime.now()
+        workflow_rows, step_rows = [], []
+        for item in items:
+            workflow_id = uuid.uuid4()
+            workflow_rows.append({
+                "id": workflow_id,
+                "user_id": user_id,
+                "name": item.name,
+                "description": item.description,
+                "is_active": item.is_active,
+                "created_at": now,
+                "updated_at": now,
+            })
+            for step in item.steps:
+                step_rows.append({
+                    "id": uuid.uuid4(),
+                    "workflow_id": workflow_id,
+                    "step_order": step.step_order,
+                    "service": step.service,
+                    "action": step.action,
+                    "config": step.config,
+                    "created_at": now,
+                })
+
+        try:
+            self.workflow_repo.bulk_create_workflows(workflow_rows, step_rows)
+        except IntegrityError:
+            # A concurrent import took some of the names between the check and the insert.
+            self._check_name_owners(user_id, names)
+            raise
+        return WorkflowImportResult(workflows=len(workflow_rows), steps=len(step_rows))
+
+    def _check_name_owners(self, user_id: uuid.UUID, names: list[str]) -> None:
+        # Names are unique across all users, so another user's name still blocks the import.
+        owners = self.workflow_repo.get_name_owners(names)
+        if owners:
+            owned = sorted(name for name, owner in owners.items() if owner == user_id)
+            raise WorkflowConflictError(owned, unavailable=len(owners) - len(owned))
+
+    def export_workflows_ndjson(self, user_id: uuid.UUID) -> Iterator[str]:
+        """One JSON document per line, produced as the rows are read."""
+        for workflow, steps in self.workflow_repo.iter_workflows_with_steps(user_id):
+            export = WorkflowExport(
+                id=workflow.id,
+                name=workflow.name,
+                description=workflow.description,
+                is_active=workflow.is_active,
+                created_at=workflow.created_at,
+                updated_at=workflow.updated_at,
+                steps=[WorkflowStepData.model_validate(step, from_attributes=True) for step in steps],
+            )
+            yield export.model_dump_json() + "\n"
@@ -1,18 +1,34 @@
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 import logging
+import threading
+import time
+from engine_logging import truncate
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class ExecutionCancelled(Exception):
+    """Raised at a cancellation checkpoint once the run has been cancelled."""
+    pass
+
+class DeadlineExceeded(ExecutionCancelled):
+    """Raised at a cancellation checkpoint once the node or workflow deadline has passed."""
+    pass
+
 class ExecutionContext:
-    def __init__(self):
+    def __init__(self, deadline: Optional[float] = None):
         self.data: Dict[str, Any] = {}
         self.history: List[str] = []
         self.errors: List[str] = []
+        # Deadlines are time.monotonic() instants; None means unbounded.
+        self.deadline = deadline
+        self.node_deadline: Optional[float] = None
+        self._cancelled = threading.Event()
 
     def set(self, key: str, value: Any):
         """Store data globally accessible to other nodes."""
-        logger.info(f"[CONTEXT] Set {key} = {value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[CONTEXT] Set %s = %s", key, truncate(value))
         self.data[key] = value
 
     def get(self, key: str) -> Optional[Any]:
@@ -25,4 +41,45 @@ class ExecutionContext:
 
     def add_error(self, error: str):
         self.errors.append(error)
-        logger.error(error)
\ No newline at end of file
+        logger.error("%s", error)
+
+    def cancel(self):
+        """Ask the run to stop at its next checkpoint."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def time_remaining(self) -> Optional[float]:
+        """Seconds until the nearest of the node and workflow deadlines, or None."""
+        deadlines = [d for d in (self.deadline, self.node_deadline) if d is not None]
+        if not deadlines:
+            return None
+        return min(deadlines) - time.monotonic()
+
+    def timeout(self, default: float) -> float:
+        """Timeout for a blocking call: `default`, capped by the remaining deadline."""
+        remaining = self.time_remaining()
+        if remaining is None:
+            return default
+        return max(0.0, min(default, remaining))
+
+    def check_deadline(self):
+        """Cancellation checkpoint; long-running nodes should call it between steps."""
+        if self.cancelled:
+            raise ExecutionCancelled("Execution cancelled")
+        remaining = self.time_remaining()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceeded("Deadline exceeded")
+
+    @contextmanager
+    def node_scope(self, timeout_seconds: Optional[float]) -> Iterator[None]:
+        """Apply a per-node deadline for the duration of the block."""
+        previous = self.node_deadline
+        if timeout_seconds is not None:
+            self.node_deadline = time.monotonic() + timeout_seconds
+        try:
+            yield
+        finally:
+            self.node_deadline = previous
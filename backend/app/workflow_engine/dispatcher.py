@@ -0,0 +1,251 @@
+from collections import Counter, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, Optional
+import logging
+import threading
+import time
+
+from workflow_engine import Workflow
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT = "default"
+# Wait samples kept per tenant for the percentile metrics.
+WAIT_SAMPLES = 1000
+
+class RunPriority(IntEnum):
+    """Lower value is dispatched first."""
+    MANUAL = 0
+    SCHEDULED = 1
+
+@dataclass
+class _Run:
+    workflow: Workflow
+    trigger_name: Optional[str]
+    tenant: str
+    priority: RunPriority
+    runner: Callable[[Workflow, Optional[str]], Any]
+    enqueued_at: float = field(default_factory=time.monotonic)
+    future: Future = field(default_factory=Future)
+
+@dataclass
+class _Tenant:
+    weight: float = 1.0
+    # Weighted fair queuing: virtual finish time of the last dispatched run.
+    virtual_time: float = 0.0
+    queues: Dict[RunPriority, Deque[_Run]] = field(
+        default_factory=lambda: {priority: deque() for priority in RunPriority}
+    )
+    running: int = 0
+    dispatched: int = 0
+    waits: Deque[float] = field(default_factory=lambda: deque(maxlen=WAIT_SAMPLES))
+
+    def queued(self) -> int:
+        return sum(len(q) for q in self.queues.values())
+
+
+def _percentile(samples: List[float], q: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _execute(workflow: Workflow, trigger_name: Optional[str]):
+    # Runs of one workflow may overlap (per_workflow_limit > 1), so each gets its own context.
+    return workflow.execute(trigger_name=trigger_name, context=workflow.new_context())
+
+
+class RunDispatcher:
+    """
+    Runs workflows on a fixed pool of worker threads, sharing it fairly between
+    users instead of first come, first served.
+
+    Manual runs are always dispatched before scheduled ones. Within a priority
+    class the backlogged user with the smallest virtual time goes next, and each
+    dispatch advances that user's virtual time by 1 / weight. Users and single
+    workflows are capped in how many runs they may have executing at once.
+    """
+
+    def __init__(
+            self,
+            max_workers: int = 8,
+            per_user_limit: int = 4,
+            per_workflow_limit: int = 1,
+    ):
+        self.max_workers = max_workers
+        self.per_user_limit = per_user_limit
+        self.per_workflow_limit = per_workflow_limit
+        self._tenants: Dict[str, _Tenant] = {}
+        self._running_workflows: Counter = Counter()
+        self._pending_workflows: Counter = Counter()
+        self._virtual_clock = 0.0
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._stopping = False
+
+    def set_weight(self, user_id: Any, weight: float) -> None:
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        with self._cond:
+            self._tenant(self._tenant_key(user_id)).weight = weight
+
+    def submit(
+            self,
+            workflow: Workflow,
+            trigger_name: Optional[str] = None,
+            priority: RunPriority = RunPriority.SCHEDULED,
+            runner: Callable[[Workflow, Optional[str]], Any] = _execute,
+    ) -> Future:
+        """Queue a run; the returned future resolves to the runner's result."""
+        tenant_key = self._tenant_key(workflow.user_id)
+        run = _Run(workflow, trigger_name, tenant_key, priority, runner)
+        with self._cond:
+            if self._stopping:
+                raise RuntimeError("Dispatcher is shut down")
+            tenant = self._tenant(tenant_key)
+            if tenant.queued() == 0 and tenant.running == 0:
+                # A user coming back from idle starts at the current clock
+                # rather than cashing in the time it was away.
+                tenant.virtual_time = max(tenant.virtual_time, self._virtual_clock)
+            tenant.queues[priority].append(run)
+            self._pending_workflows[workflow.name] += 1
+            self._cond.notify()
+        return run.future
+
+    def pending_runs(self, workflow: Workflow) -> int:
+        """Queued plus running runs of the workflow."""
+        with self._cond:
+            return self._pending_workflows[workflow.name]
+
+    def queued_runs(self, workflow: Workflow) -> int:
+        """Runs of the workflow waiting for a worker."""
+        with self._cond:
+            return self._pending_workflows[workflow.name] - self._running_workflows[workflow.name]
+
+    def cancel_queued(self, workflow: Workflow) -> int:
+        """Drop the workflow's runs that have not started; their futures are cancelled."""
+        cancelled = 0
+        with self._cond:
+            for tenant in self._tenants.values():
+                for q in tenant.queues.values():
+                    for run in [r for r in q if r.workflow.name == workflow.name]:
+                        q.remove(run)
+                        run.future.cancel()
+                        cancelled += 1
+            self._pending_workflows[workflow.name] -= cancelled
+        return cancelled
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-user queue depth, running count and wait times in seconds."""
+        now = time.monotonic()
+        with self._cond:
+            result = {}
+            for key, tenant in self._tenants.items():
+                waits = list(tenant.waits)
+                oldest = [q[0].enqueued_at for q in tenant.queues.values() if q]
+                result[key] = {
+                    "weight": tenant.weight,
+                    "queue_depth": tenant.queued(),
+                    "queue_depth_by_priority": {p.name.lower(): len(q) for p, q in tenant.queues.items()},
+                    "running": tenant.running,
+                    "dispatched": tenant.dispatched,
+                    "oldest_wait_s": now - min(oldest) if oldest else 0.0,
+                    "wait_p50_s": _percentile(waits, 0.50),
+                    "wait_p95_s": _percentile(waits, 0.95),
+                }
+            return result
+
+    def start(self) -> None:
+        with self._cond:
+            if self._workers:
+                return
+            self._stopping = False
+            for i in range(self.max_workers):
+                worker = threading.Thread(target=self._work, name=f"run-dispatcher-{i}", daemon=True)
+                self._workers.append(worker)
+                worker.start()
+        logger.info("Run dispatcher started with %s workers", self.max_workers)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting runs; queued runs are cancelled, running ones finish."""
+        with self._cond:
+            self._stopping = True
+            for tenant in self._tenants.values():
+                for q in tenant.queues.values():
+                    while q:
+                        run = q.popleft()
+                        self._pending_workflows[run.workflow.name] -= 1
+                        run.future.cancel()
+            self._cond.notify_all()
+            workers, self._workers = self._workers, []
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    @staticmethod
+    def _tenant_key(user_id: Any) -> str:
+        return str(user_id) if user_id is not None else DEFAULT_TENANT
+
+    def _tenant(self, key: str) -> _Tenant:
+        tenant = self._tenants.get(key)
+        if tenant is None:
+            tenant = self._tenants[key] = _Tenant()
+        return tenant
+
+    def _eligible_run(self, tenant: _Tenant, priority: RunPriority) -> Optional[_Run]:
+        if tenant.running >= self.per_user_limit:
+            return None
+        for run in tenant.queues[priority]:
+            if self._running_workflows[run.workflow.name] < self.per_workflow_limit:
+                return run
+        return None
+
+    def _next_run(self) -> Optional[_Run]:
+        """Pick the next run; caller holds the lock."""
+        for priority in RunPriority:
+            best: Optional[_Run] = None
+            best_tenant: Optional[_Tenant] = None
+            for tenant in self._tenants.values():
+                if best_tenant is not None and tenant.virtual_time >= best_tenant.virtual_time:
+                    continue
+                run = self._eligible_run(tenant, priority)
+                if run is not None:
+                    best, best_tenant = run, tenant
+            if best is not None:
+                best_tenant.queues[priority].remove(best)
+                self._virtual_clock = best_tenant.virtual_time
+                best_tenant.virtual_time += 1.0 / best_tenant.weight
+                return best
+        return None
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                run = self._next_run()
+                while run is None:
+                    if self._stopping:
+                        return
+                    self._cond.wait()
+                    run = self._next_run()
+                tenant = self._tenants[run.tenant]
+                tenant.running += 1
+                tenant.dispatched += 1
+                tenant.waits.append(time.monotonic() - run.enqueued_at)
+                self._running_workflows[run.workflow.name] += 1
+
+            try:
+                if run.future.set_running_or_notify_cancel():
+                    run.future.set_result(run.runner(run.workflow, run.trigger_name))
+            except BaseException as e:
+                logger.exception("Run of %s failed", run.workflow.name)
+                run.future.set_exception(e)
+            finally:
+                with self._cond:
+                    tenant.running -= 1
+                    self._running_workflows[run.workflow.name] -= 1
+                    self._pending_workflows[run.workflow.name] -= 1
+                    # Finishing frees a user/workflow slot that may unblock any waiter.
+                    self._cond.notify_all()
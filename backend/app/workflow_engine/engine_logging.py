@@ -0,0 +1,130 @@
+import atexit
+import json
+import logging
+import queue
+import reprlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Iterator, Optional, TextIO
+
+_run_id: ContextVar[Optional[str]] = ContextVar("run_id", default=None)
+_node: ContextVar[Optional[str]] = ContextVar("node", default=None)
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+# Bounded repr: large strings/collections are cut while being rendered, so
+# logging a whole HTTP body or context value costs the same as a small one.
+_value_repr = reprlib.Repr()
+_value_repr.maxstring = 200
+_value_repr.maxother = 200
+_value_repr.maxlist = _value_repr.maxdict = _value_repr.maxset = _value_repr.maxtuple = 10
+_value_repr.maxlevel = 3
+
+
+def truncate(value: Any) -> str:
+    """
+    Bounded repr of a log argument. Call it on the logging thread (behind an
+    isEnabledFor guard) so the record holds a snapshot, not a live reference
+    the listener would render after the value has changed.
+    """
+    return _value_repr.repr(value)
+
+
+@contextmanager
+def log_context(run_id: Optional[str] = None, node: Optional[str] = None) -> Iterator[None]:
+    """Attach run/node IDs to every record logged inside the block."""
+    tokens = []
+    if run_id is not None:
+        tokens.append((_run_id, _run_id.set(run_id)))
+    if node is not None:
+        tokens.append((_node, _node.set(node)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Stamp records with the current run/node on the calling thread, where the context vars live."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.run_id = _run_id.get()
+        record.node = _node.get()
+        return True
+
+
+class StructuredFormatter(logging.Formatter):
+    """One JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        run_id = getattr(record, "run_id", None)
+        if run_id is not None:
+            entry["run_id"] = run_id
+        node = getattr(record, "node", None)
+        if node is not None:
+            entry["node"] = node
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler.prepare() formats the message on the calling thread; keep
+    msg/args as-is so formatting happens on the listener thread instead.
+    Arguments are therefore rendered later: pass immutable values or
+    truncate() snapshots, never live mutable containers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging(level: int = logging.INFO, stream: Optional[TextIO] = None) -> QueueListener:
+    """
+    Route the root logger through a queue drained by a background thread.
+    Calling it again reconfigures the level but keeps the same listener.
+    """
+    global _listener, _queue_handler
+    root = logging.getLogger()
+    root.setLevel(level)
+    if _listener is not None:
+        return _listener
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(StructuredFormatter())
+
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    _queue_handler = queue_handler
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Detach the queue handler, flush queued records and stop the listener thread."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
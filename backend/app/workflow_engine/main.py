@@ -1,3 +1,5 @@
+from engine_logging import configure_logging
+from dispatcher import RunDispatcher
 from scheduler import WorkflowScheduler
 from workflow_engine import Workflow
 from nodes.trigger_nodes import ManualTrigger, ScheduleTrigger
@@ -48,13 +50,14 @@ def create_sample_workflow() -> Workflow:
     return workflow
 
 if __name__ == "__main__":
+    configure_logging()
     workflow = create_sample_workflow()
 
-    scheduler = WorkflowScheduler()
+    scheduler = WorkflowScheduler(dispatcher=RunDispatcher())
     scheduler.register_workflow(workflow)
     scheduler.start()
 
-    workflow.execute()  # Initial manual run
+    scheduler.run_manual(workflow)  # Initial manual run
     try: 
         while True:
             pass  # Keep the main thread alive
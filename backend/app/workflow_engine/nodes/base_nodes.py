@@ -1,6 +1,6 @@
 from enum import Enum
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from context import ExecutionContext
 
 class NodeType(Enum):
@@ -9,6 +9,11 @@ class NodeType(Enum):
     TRANSFORM = "transform"
     SENDEMAIL = "send_email"
 
+class TriggerType(Enum):
+    MANUAL = "manual"
+    SCHEDULE = "schedule"
+    WEBHOOK = "webhook"
+
 class NodeExecutionError(Exception):
     """Custom exception for node execution errors"""
     pass
@@ -22,6 +27,12 @@ class BaseNode(ABC):
     def execute(self, context: ExecutionContext) -> Any:
         pass
 
+    @property
+    def timeout_seconds(self) -> Optional[float]:
+        """Per-node deadline, configured through the `timeout_seconds` parameter."""
+        timeout = self.parameters.get("timeout_seconds")
+        return float(timeout) if timeout is not None else None
+
     def validate_parameters(self) -> bool:
         """Override this method to add parameter validation"""
         return True
@@ -40,7 +40,8 @@ class SendEmailNode(BaseNode):
         subject = self._render(self.parameters["subject"], context)
         body = self._render(self.parameters["body"], context)
 
-        logger.info(f"[EMAIL] Sending Gmail message to {to}")
+        context.check_deadline()
+        logger.debug("[EMAIL] Sending Gmail message to %s", to)
 
         try:
             yag = yagmail.SMTP(from_email, app_password)
@@ -6,9 +6,10 @@ from typing import Any, Dict
 from nodes.base_nodes import BaseNode, NodeType, NodeExecutionError
 from context import ExecutionContext
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_TIMEOUT_SECONDS = 10
+
 class HttpRequestNode(BaseNode):
     def __init__(self, name: str, parameters: Dict[str, Any]):
         super().__init__(name, parameters)
@@ -27,7 +28,8 @@ class HttpRequestNode(BaseNode):
         headers = self.parameters.get("headers", {})
         body = self.parameters.get("body", None)
 
-        logger.info(f"[HTTP] {method} {url}")
+        context.check_deadline()
+        logger.debug("[HTTP] %s %s", method, url)
 
         try:
             response = requests.request(
@@ -35,7 +37,7 @@ class HttpRequestNode(BaseNode):
                 url=url,
                 json=body,
                 headers=headers,
-                timeout=10
+                timeout=context.timeout(self.parameters.get("timeout", DEFAULT_TIMEOUT_SECONDS))
             )
         except Exception as e:
             error_message = f"HTTP request failed: {str(e)}"
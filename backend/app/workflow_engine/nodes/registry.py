@@ -0,0 +1,69 @@
+import importlib
+import logging
+from importlib.metadata import entry_points
+from typing import Any, Dict, Type, Union
+from nodes.base_nodes import BaseNode, NodeExecutionError
+
+logger = logging.getLogger(__name__)
+
+# Third-party packages can ship node types by declaring
+# [project.entry-points."autofluo.nodes"] my_node = "my_pkg.nodes:MyNode"
+ENTRY_POINT_GROUP = "autofluo.nodes"
+
+# Node type -> "module:ClassName". Modules are imported the first time a
+# workflow uses the type, so optional dependencies (yagmail, jinja2, requests,
+# croniter, pytz) are only loaded by workers that actually need them.
+_node_paths: Dict[str, str] = {
+    "manual_trigger": "nodes.trigger_nodes:ManualTrigger",
+    "schedule_trigger": "nodes.trigger_nodes:ScheduleTrigger",
+    "http_request": "nodes.http_nodes:HttpRequestNode",
+    "send_email": "nodes.email_nodes:SendEmailNode",
+    "transform": "workflow_engine:TransformNode",
+}
+_node_classes: Dict[str, Type[BaseNode]] = {}
+_entry_points_loaded = False
+
+
+def register_node(node_type: str, target: Union[str, Type[BaseNode]]) -> None:
+    """Register a node class, or a lazy "module:ClassName" path to it."""
+    _node_classes.pop(node_type, None)
+    if isinstance(target, str):
+        _node_paths[node_type] = target
+    else:
+        _node_paths.pop(node_type, None)
+        _node_classes[node_type] = target
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    # Only the entry point metadata is read here; the target module is imported on use.
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        _node_paths.setdefault(ep.name, ep.value)
+
+
+def get_node_class(node_type: str) -> Type[BaseNode]:
+    if node_type in _node_classes:
+        return _node_classes[node_type]
+    if node_type not in _node_paths:
+        _load_entry_points()
+    path = _node_paths.get(node_type)
+    if path is None:
+        raise NodeExecutionError(f"Unknown node type: {node_type}")
+
+    module_name, _, class_name = path.partition(":")
+    logger.debug("Loading node type %s from %s", node_type, module_name)
+    node_class = getattr(importlib.import_module(module_name), class_name)
+    _node_classes[node_type] = node_class
+    return node_class
+
+
+def available_node_types() -> list[str]:
+    _load_entry_points()
+    return sorted(set(_node_paths) | set(_node_classes))
+
+
+def create_node(node_type: str, name: str, parameters: Dict[str, Any]) -> BaseNode:
+    return get_node_class(node_type)(name, parameters)
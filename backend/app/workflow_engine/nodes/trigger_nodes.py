@@ -1,21 +1,11 @@
-from enum import Enum
-from abc import abstractmethod
 from datetime import datetime
 from typing import Any, Dict
-from croniter import croniter
-import pytz
-from nodes.base_nodes import BaseNode, NodeType, NodeExecutionError
+from nodes.base_nodes import BaseNode, NodeType, NodeExecutionError, TriggerType
 from context import ExecutionContext
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class TriggerType(Enum):
-    MANUAL = "manual"
-    SCHEDULE = "schedule"
-    WEBHOOK = "webhook"
-
 class BaseTrigger(BaseNode):
     def __init__(self, name: str, trigger_type: TriggerType, parameters: Dict[str, Any]):
         super().__init__(name, parameters)
@@ -27,7 +17,7 @@ class ManualTrigger(BaseTrigger):
         super().__init__(name, TriggerType.MANUAL, parameters)
 
     def execute(self, context: ExecutionContext) -> Dict[str, Any]:
-        logger.info("Manual trigger activated")
+        logger.debug("Manual trigger activated")
         return {
             "trigger_type": "manual",
             "timestamp": datetime.now().isoformat()
@@ -46,6 +36,8 @@ class ScheduleTrigger(BaseTrigger):
             raise NodeExecutionError("schedule_type is required (interval or cron)")
             
         if schedule_type == "cron":
+            from croniter import croniter
+
             cron_expr = self.parameters.get("cron_expression")
             if not cron_expr or not croniter.is_valid(cron_expr):
                 raise NodeExecutionError("Invalid cron expression")
@@ -54,7 +46,9 @@ class ScheduleTrigger(BaseTrigger):
                 raise NodeExecutionError("interval_minutes is required for interval schedule")
 
     def execute(self, context: ExecutionContext) -> Dict[str, Any]:
-        logger.info("Schedule trigger activated")
+        import pytz
+
+        logger.debug("Schedule trigger activated")
         now = datetime.now(pytz.timezone(self.timezone))
         self.last_execution = now
         return {
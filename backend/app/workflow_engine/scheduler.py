@@ -1,19 +1,48 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, Optional, Set
 from workflow_engine import Workflow
+from dispatcher import RunDispatcher, RunPriority
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on fires of one workflow waiting behind a running one (QUEUE).
+MAX_PENDING_RUNS = 3
+# How often dispatcher metrics are logged when a dispatcher is configured.
+METRICS_INTERVAL_SECONDS = 60
+
+class OverlapPolicy(Enum):
+    SKIP = "skip"                        # drop a fire while the workflow is still running
+    QUEUE = "queue"                      # run it once the previous run finishes
+    CANCEL_PREVIOUS = "cancel_previous"  # cancel the running one, then run
+
 class WorkflowScheduler:
-    def __init__(self):
+    def __init__(self, overlap_policy: OverlapPolicy = OverlapPolicy.SKIP, dispatcher: Optional[RunDispatcher] = None):
         self.scheduler = BackgroundScheduler()
+        # When set, fires are handed to the dispatcher instead of running on APScheduler's pool.
+        self.dispatcher = dispatcher
         self.workflows = []
+        self.overlap_policy = overlap_policy
+        self._policies: Dict[str, OverlapPolicy] = {}
+        # Overlapping fires are recorded here instead of parking APScheduler threads;
+        # the thread running a workflow drains its pending fires when it finishes.
+        self._state_lock = threading.Lock()
+        self._running: Set[str] = set()
+        self._pending: Dict[str, Deque[str]] = {}
 
-    def register_workflow(self, workflow: Workflow):
+    def register_workflow(self, workflow: Workflow, overlap_policy: Optional[OverlapPolicy] = None):
         """Register a workflow and its schedule triggers"""
         self.workflows.append(workflow)
+        policy = overlap_policy or self.overlap_policy
+        self._policies[workflow.name] = policy
+        # A second instance of a job only records a pending fire and returns,
+        # so it never holds a pool thread for long.
+        max_instances = 1 if policy == OverlapPolicy.SKIP else 2
         for node in workflow.nodes:
             if node.type.value == "trigger" and hasattr(node, "parameters"):
                 schedule_type = node.parameters.get("schedule_type")
@@ -25,9 +54,10 @@ class WorkflowScheduler:
                         self.run_workflow,
                         CronTrigger.from_crontab(cron_expr, timezone=timezone),
                         args=[workflow, node.name],
-                        id=f"{workflow.name}-{node.name}"
+                        id=f"{workflow.name}-{node.name}",
+                        max_instances=max_instances,
                     )
-                    logger.info(f"Registered cron job for {workflow.name}: {cron_expr}")
+                    logger.info("Registered cron job for %s: %s", workflow.name, cron_expr)
 
                 elif schedule_type == "interval":
                     minutes = node.parameters.get("interval_minutes", 5)
@@ -35,18 +65,98 @@ class WorkflowScheduler:
                         self.run_workflow,
                         IntervalTrigger(minutes=minutes),
                         args=[workflow, node.name],
-                        id=f"{workflow.name}-{node.name}"
+                        id=f"{workflow.name}-{node.name}",
+                        max_instances=max_instances,
                     )
-                    logger.info(f"Registered interval job for {workflow.name}: every {minutes}m")
+                    logger.info("Registered interval job for %s: every %sm", workflow.name, minutes)
 
     def run_workflow(self, workflow: Workflow, trigger_name: str):
-        logger.info(f"Executing scheduled workflow {workflow.name} via {trigger_name}")
-        workflow.execute(trigger_name=trigger_name)
+        if self.dispatcher is not None:
+            self._dispatch(workflow, trigger_name)
+            return
+
+        with self._state_lock:
+            if workflow.name in self._running:
+                self._record_overlap(workflow, trigger_name)
+                return
+            self._running.add(workflow.name)
+
+        while trigger_name is not None:
+            try:
+                logger.info("Executing scheduled workflow %s via %s", workflow.name, trigger_name)
+                workflow.execute(trigger_name=trigger_name)
+            finally:
+                with self._state_lock:
+                    pending = self._pending.get(workflow.name)
+                    trigger_name = pending.popleft() if pending else None
+                    if trigger_name is None:
+                        self._running.discard(workflow.name)
+
+    def _record_overlap(self, workflow: Workflow, trigger_name: str):
+        """Apply the overlap policy to a fire that arrived mid-run; caller holds _state_lock."""
+        policy = self._policies.get(workflow.name, self.overlap_policy)
+        pending = self._pending.setdefault(workflow.name, deque())
+        if policy == OverlapPolicy.SKIP:
+            logger.info("Skipping %s via %s: previous run still in progress", workflow.name, trigger_name)
+        elif policy == OverlapPolicy.CANCEL_PREVIOUS:
+            logger.info("Cancelling running %s in favour of %s", workflow.name, trigger_name)
+            pending.clear()
+            pending.append(trigger_name)
+            workflow.cancel()
+        elif len(pending) >= MAX_PENDING_RUNS:
+            logger.warning("Dropping %s via %s: %s runs already queued", workflow.name, trigger_name, len(pending))
+        else:
+            pending.append(trigger_name)
+
+    def run_manual(self, workflow: Workflow):
+        """
+        Manual run (user clicks run). Goes ahead of scheduled runs when a
+        dispatcher is configured; returns its future, or the context when run inline.
+        """
+        if self.dispatcher is not None:
+            logger.info("Dispatching manual run of %s", workflow.name)
+            return self.dispatcher.submit(workflow, priority=RunPriority.MANUAL)
+        return workflow.execute()
+
+    def _dispatch(self, workflow: Workflow, trigger_name: str):
+        # The dispatcher's per-workflow cap serializes runs; the policy decides what queues behind them.
+        policy = self._policies.get(workflow.name, self.overlap_policy)
+        if self.dispatcher.pending_runs(workflow):
+            if policy == OverlapPolicy.SKIP:
+                logger.info("Skipping %s via %s: previous run still pending", workflow.name, trigger_name)
+                return
+            if policy == OverlapPolicy.CANCEL_PREVIOUS:
+                dropped = self.dispatcher.cancel_queued(workflow)
+                logger.info("Cancelling %s (%s queued) in favour of %s", workflow.name, dropped, trigger_name)
+                workflow.cancel()
+            elif self.dispatcher.queued_runs(workflow) >= MAX_PENDING_RUNS:
+                logger.warning("Dropping %s via %s: %s runs already queued", workflow.name, trigger_name, MAX_PENDING_RUNS)
+                return
+        logger.info("Dispatching scheduled workflow %s via %s", workflow.name, trigger_name)
+        self.dispatcher.submit(workflow, trigger_name, RunPriority.SCHEDULED)
+
+    def log_dispatcher_metrics(self):
+        for tenant, stats in self.dispatcher.metrics().items():
+            logger.info(
+                "Tenant %s: queued=%s running=%s dispatched=%s wait_p50=%s wait_p95=%s oldest_wait=%.3fs",
+                tenant, stats["queue_depth"], stats["running"], stats["dispatched"],
+                stats["wait_p50_s"], stats["wait_p95_s"], stats["oldest_wait_s"],
+            )
 
     def start(self):
         logger.info("Starting workflow scheduler...")
+        if self.dispatcher is not None:
+            self.dispatcher.start()
+            self.scheduler.add_job(
+                self.log_dispatcher_metrics,
+                IntervalTrigger(seconds=METRICS_INTERVAL_SECONDS),
+                id="dispatcher-metrics",
+                replace_existing=True,
+            )
         self.scheduler.start()
 
     def shutdown(self):
         logger.info("Shutting down scheduler...")
-        self.scheduler.shutdown()
\ No newline at end of file
+        self.scheduler.shutdown()
+        if self.dispatcher is not None:
+            self.dispatcher.shutdown()
\ No newline at end of file
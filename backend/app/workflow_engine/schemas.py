@@ -17,11 +17,13 @@ class Connection(BaseModel):
 
 class WorkflowSchema(BaseModel):
     id: Optional[str] = None
+    user_id: Optional[str] = None
     name: str
     description: Optional[str] = ""
     nodes: List[Node]
     connections: List[Connection]
     is_active: bool = False
+    timeout_seconds: Optional[float] = None
 
 class ExecutionResult(BaseModel):
     node_id: str
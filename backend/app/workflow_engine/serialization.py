@@ -0,0 +1,251 @@
+"""
+Binary encoding for data that leaves the engine process: execution context
+snapshots, ExecutionResult records and workflow definitions.
+
+Every blob starts with a 5 byte header (magic, envelope version, codec,
+flags) followed by the payload. msgpack is used when installed, stdlib json
+otherwise; either codec can always be decoded. Payloads above
+COMPRESS_THRESHOLD bytes are zlib-compressed. Each record kind carries its own
+schema version so stored blobs can be upgraded when the shapes change.
+
+Both codecs carry the same values: None, bool, int, float, str, bytes,
+lists/tuples (decoded as lists) and dicts with str keys. Anything else raises
+SerializationError rather than being coerced; convert datetimes, UUIDs and the
+like before encoding. The C encoders enforce value types. Map keys are
+checked before encoding on the JSON path, where json would stringify them,
+and by strict_map_key when decoding msgpack. msgpack also limits integers to
+64 bits.
+"""
+from base64 import b64decode, b64encode
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+import json
+import struct
+import zlib
+
+from pydantic import BaseModel, ValidationError
+
+from context import ExecutionContext
+from schemas import ExecutionResult, WorkflowSchema
+
+try:
+    import msgpack
+except ImportError:  # optional dependency
+    msgpack = None
+
+MAGIC = b"AF"
+ENVELOPE_VERSION = 1
+_HEADER = struct.Struct("!2sBBB")
+
+CODEC_JSON = 0
+CODEC_MSGPACK = 1
+
+FLAG_ZLIB = 0x01
+COMPRESS_THRESHOLD = 4096
+COMPRESS_LEVEL = 1
+# Blobs may come from outside the process; refuse to inflate past this.
+MAX_DECOMPRESSED_SIZE = 64 * 1024 * 1024
+
+# JSON has no bytes type, so the JSON codec wraps them as {"__bytes__": "<base64>"}.
+BYTES_TAG = "__bytes__"
+
+# Current schema version per record kind; bump and add an upgrader when a shape changes.
+SCHEMA_VERSIONS: Dict[str, int] = {
+    "context": 1,
+    "execution_result": 1,
+    "workflow": 1,
+}
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# (kind, from_version) -> function upgrading the payload to from_version + 1
+UPGRADERS: Dict[Tuple[str, int], Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+
+
+class SerializationError(Exception):
+    pass
+
+
+def _msgpack_default(value: Any) -> Any:
+    """
+    Called by the C packer (strict_types=True) for anything that is not an
+    exact builtin type: unwrap subclasses and tuples, reject everything else.
+    """
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, str):
+        return str.__str__(value)
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return float(value)
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, bytearray):
+        return bytes(value)
+    raise SerializationError(f"Cannot serialize value of type {type(value).__name__}")
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray)):
+        return {BYTES_TAG: b64encode(value).decode()}
+    raise SerializationError(f"Cannot serialize value of type {type(value).__name__}")
+
+
+def _check_json_keys(value: Any) -> None:
+    """
+    json.dumps silently turns int/float/bool/None keys into strings and cannot
+    tell the bytes tag from user data, so check maps before encoding. Only
+    containers are visited; scalar values are left to the C encoder.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            for key in item:
+                if not isinstance(key, str):
+                    raise SerializationError(f"Map keys must be str, got {type(key).__name__}: {key!r}")
+            if len(item) == 1 and BYTES_TAG in item:
+                raise SerializationError(f"{BYTES_TAG!r} is reserved as a single-key map")
+            stack.extend(v for v in item.values() if isinstance(v, (dict, list, tuple)))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(v for v in item if isinstance(v, (dict, list, tuple)))
+
+
+def _json_object_hook(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and BYTES_TAG in obj:
+        return b64decode(obj[BYTES_TAG])
+    return obj
+
+
+def default_codec() -> int:
+    return CODEC_MSGPACK if msgpack is not None else CODEC_JSON
+
+
+def _dump(obj: Any, codec: int) -> bytes:
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise SerializationError("msgpack is not installed")
+        try:
+            return msgpack.packb(obj, use_bin_type=True, strict_types=True, default=_msgpack_default)
+        except (OverflowError, ValueError, TypeError) as e:
+            raise SerializationError(f"Cannot serialize value: {e}") from e
+    _check_json_keys(obj)
+    try:
+        return json.dumps(obj, default=_json_default, separators=(",", ":")).encode()
+    except (ValueError, TypeError) as e:
+        raise SerializationError(f"Cannot serialize value: {e}") from e
+
+
+def _load(payload: bytes, codec: int) -> Any:
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise SerializationError("msgpack is not installed")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=True)
+    if codec == CODEC_JSON:
+        return json.loads(payload, object_hook=_json_object_hook)
+    raise SerializationError(f"Unknown codec: {codec}")
+
+
+def encode(kind: str, data: Any, codec: Optional[int] = None, compress: Optional[bool] = None) -> bytes:
+    """
+    Encode `data` as a versioned record of `kind`. `compress=None` compresses
+    only payloads larger than COMPRESS_THRESHOLD.
+    """
+    if kind not in SCHEMA_VERSIONS:
+        raise SerializationError(f"Unknown record kind: {kind}")
+    codec = default_codec() if codec is None else codec
+    payload = _dump({"k": kind, "v": SCHEMA_VERSIONS[kind], "d": data}, codec)
+
+    flags = 0
+    if compress or (compress is None and len(payload) > COMPRESS_THRESHOLD):
+        payload = zlib.compress(payload, COMPRESS_LEVEL)
+        flags |= FLAG_ZLIB
+    return _HEADER.pack(MAGIC, ENVELOPE_VERSION, codec, flags) + payload
+
+
+def decode(blob: bytes, kind: str) -> Any:
+    """Decode a record of `kind`, upgrading it to the current schema version."""
+    if kind not in SCHEMA_VERSIONS:
+        raise SerializationError(f"Unknown record kind: {kind}")
+    if len(blob) < _HEADER.size:
+        raise SerializationError("Truncated record")
+    magic, envelope_version, codec, flags = _HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise SerializationError("Not an autofluo record")
+    if envelope_version > ENVELOPE_VERSION:
+        raise SerializationError(f"Unsupported envelope version: {envelope_version}")
+
+    payload = memoryview(blob)[_HEADER.size:]
+    try:
+        if flags & FLAG_ZLIB:
+            inflater = zlib.decompressobj()
+            payload = inflater.decompress(payload, MAX_DECOMPRESSED_SIZE)
+            if inflater.unconsumed_tail:
+                raise SerializationError(f"Record inflates past {MAX_DECOMPRESSED_SIZE} bytes")
+        record = _load(bytes(payload), codec)
+    except (zlib.error, ValueError, TypeError) as e:
+        raise SerializationError(f"Corrupt record: {e}") from e
+
+    if not isinstance(record, dict) or not {"k", "v", "d"} <= record.keys():
+        raise SerializationError("Malformed record envelope")
+    if record["k"] != kind:
+        raise SerializationError(f"Expected a {kind} record, got {record['k']}")
+    version, data = record["v"], record["d"]
+    if not isinstance(version, int):
+        raise SerializationError(f"Invalid schema version: {version!r}")
+    if version > SCHEMA_VERSIONS[kind]:
+        raise SerializationError(f"{kind} schema version {version} is newer than supported")
+    while version < SCHEMA_VERSIONS[kind]:
+        upgrade = UPGRADERS.get((kind, version))
+        if upgrade is None:
+            raise SerializationError(f"No upgrade path for {kind} schema version {version}")
+        data = upgrade(data)
+        version += 1
+    return data
+
+
+def encode_context(context: ExecutionContext, **kwargs) -> bytes:
+    """Snapshot of data, history and errors; deadlines are process-local and not kept."""
+    snapshot = {"data": context.data, "history": context.history, "errors": context.errors}
+    return encode("context", snapshot, **kwargs)
+
+
+def decode_context(blob: bytes) -> ExecutionContext:
+    snapshot = decode(blob, "context")
+    if (
+        not isinstance(snapshot, dict)
+        or not isinstance(snapshot.get("data"), dict)
+        or not isinstance(snapshot.get("history"), list)
+        or not isinstance(snapshot.get("errors"), list)
+    ):
+        raise SerializationError("Malformed context snapshot")
+    context = ExecutionContext()
+    context.data = snapshot["data"]
+    context.history = snapshot["history"]
+    context.errors = snapshot["errors"]
+    return context
+
+
+def encode_result(result: ExecutionResult, **kwargs) -> bytes:
+    return encode("execution_result", result.model_dump(), **kwargs)
+
+
+def _validate_model(model: Type[ModelT], data: Any) -> ModelT:
+    try:
+        return model.model_validate(data)
+    except ValidationError as e:
+        raise SerializationError(f"Malformed {model.__name__}: {e}") from e
+
+
+def decode_result(blob: bytes) -> ExecutionResult:
+    return _validate_model(ExecutionResult, decode(blob, "execution_result"))
+
+
+def encode_workflow(workflow: WorkflowSchema, **kwargs) -> bytes:
+    return encode("workflow", workflow.model_dump(), **kwargs)
+
+
+def decode_workflow(blob: bytes) -> WorkflowSchema:
+    return _validate_model(WorkflowSchema, decode(blob, "workflow"))
@@ -1,12 +1,15 @@
-from typing import Any, Dict, List, Optional
-import requests
+from typing import Any, Dict, List, Optional, Set
+import asyncio
 import logging
-from nodes.base_nodes import BaseNode, NodeType, NodeExecutionError
-from context import ExecutionContext
-from nodes.trigger_nodes import TriggerType
+import threading
+import time
+import uuid
+from engine_logging import log_context
+from nodes.base_nodes import BaseNode, NodeType, NodeExecutionError, TriggerType
+from nodes.registry import create_node
+from context import ExecutionCancelled, ExecutionContext
+from schemas import WorkflowSchema
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class TransformNode(BaseNode):
@@ -40,7 +43,7 @@ class TransformNode(BaseNode):
         else:
             raise NodeExecutionError(f"Operation {operation} not implemented")
 
-        logger.info(f"Transform operation {operation} completed")
+        logger.debug("Transform operation %s completed", operation)
         return result
 
 class EmailNode(BaseNode):
@@ -57,15 +60,41 @@ class EmailNode(BaseNode):
 
         recipient = self.parameters["to"]
         # Implement actual email sending logic here
-        logger.info(f"Email sent to {recipient}")
+        logger.debug("Email sent to %s", recipient)
         return None
 
 class Workflow:
-    def __init__(self, name: str):
+    def __init__(self, name: str, timeout_seconds: Optional[float] = None, user_id: Optional[str] = None):
         self.name = name
+        self.user_id = user_id
+        self.timeout_seconds = timeout_seconds
         self.nodes: List[BaseNode] = []
         self.connections: Dict[str, List[BaseNode]] = {}
+        # Context of the most recently started run; concurrent runs each get their own.
         self.context = ExecutionContext()
+        self._active_contexts: Set[ExecutionContext] = set()
+        self._active_lock = threading.Lock()
+
+    @classmethod
+    def from_schema(cls, schema: WorkflowSchema) -> "Workflow":
+        """Build a workflow from its definition, importing only the node types it uses."""
+        workflow = cls(name=schema.name, timeout_seconds=schema.timeout_seconds, user_id=schema.user_id)
+        by_key: Dict[str, BaseNode] = {}
+        for node_def in schema.nodes:
+            if node_def.disabled:
+                continue
+            node = create_node(node_def.type, node_def.name, node_def.parameters)
+            workflow.add_node(node)
+            by_key[node_def.id] = node
+            by_key[node_def.name] = node
+
+        for connection in schema.connections:
+            source = by_key.get(connection.source_node)
+            target = by_key.get(connection.target_node)
+            if source is None or target is None:
+                continue
+            workflow.connections.setdefault(source.name, []).append(target)
+        return workflow
 
     def add_node(self, node: BaseNode) -> None:
         self.nodes.append(node)
@@ -76,19 +105,66 @@ class Workflow:
     def add_connection(self, from_node: str, to_nodes: List[BaseNode]) -> None:
         self.connections[from_node] = to_nodes
 
-    def execute(self, trigger_name: str = None) -> ExecutionContext:
-        logger.info(f"Starting workflow execution: {self.name}")
+    def new_context(self) -> ExecutionContext:
+        """Fresh context for one run, carrying the workflow deadline if any."""
+        deadline = None
+        if self.timeout_seconds is not None:
+            deadline = time.monotonic() + self.timeout_seconds
+        return ExecutionContext(deadline=deadline)
+
+    def cancel(self) -> None:
+        """Cooperatively cancel every run of this workflow that is in progress."""
+        with self._active_lock:
+            for context in self._active_contexts:
+                context.cancel()
+
+    def execute(self, trigger_name: str = None, context: Optional[ExecutionContext] = None) -> ExecutionContext:
+        context = context or self.new_context()
+        self.context = context
+        with self._active_lock:
+            self._active_contexts.add(context)
+        try:
+            with log_context(run_id=uuid.uuid4().hex):
+                return self._execute(trigger_name, context)
+        finally:
+            with self._active_lock:
+                self._active_contexts.discard(context)
+
+    async def execute_async(self, trigger_name: str = None) -> ExecutionContext:
+        """
+        Run on a worker thread without blocking the event loop. When the
+        workflow deadline passes or the awaiting task is cancelled, the run is
+        cancelled and this waits for the thread to reach its next checkpoint,
+        so the returned context is no longer being written to.
+        """
+        context = self.new_context()
+        run = asyncio.ensure_future(asyncio.to_thread(self.execute, trigger_name, context))
+        try:
+            await asyncio.wait_for(asyncio.shield(run), timeout=context.time_remaining())
+        except asyncio.TimeoutError:
+            context.cancel()
+            context.add_error(f"Workflow {self.name} exceeded its deadline")
+            await asyncio.shield(run)
+        except asyncio.CancelledError:
+            context.cancel()
+            await asyncio.shield(run)
+            raise
+        return context
+
+    def _execute(self, trigger_name: str, context: ExecutionContext) -> ExecutionContext:
+        logger.info("Starting workflow execution: %s", self.name)
         execution_queue: List[BaseNode] = []
         executed: List[str] = []
 
         if trigger_name:
             trigger_node = self.get_node(trigger_name)
             if not trigger_node:
-                self.context.add_error(f"Trigger node {trigger_name} not found")
-                return self.context
+                context.add_error(f"Trigger node {trigger_name} not found")
+                return context
             
-            logger.info(f"Executing workflow '{self.name}' from external trigger: {trigger_name}")
-            result = trigger_node.execute(self.context)
+            logger.info("Executing workflow '%s' from external trigger: %s", self.name, trigger_name)
+            with log_context(node=trigger_node.name):
+                result = trigger_node.execute(context)
             if result:
                 execution_queue.extend(self.connections.get(trigger_node.name, []))
         else:
@@ -98,8 +174,9 @@ class Workflow:
                 if node.type == NodeType.TRIGGER and getattr(node, "trigger_type", None) == TriggerType.MANUAL
             ]
             for trigger in trigger_nodes:
-                logger.info(f"Firing manual trigger: {trigger.name}")
-                result = trigger.execute(self.context)
+                logger.debug("Firing manual trigger: %s", trigger.name)
+                with log_context(node=trigger.name):
+                    result = trigger.execute(context)
                 if result:
                     execution_queue.extend(self.connections.get(trigger.name, []))
 
@@ -107,19 +184,31 @@ class Workflow:
         while execution_queue:
             current_node = execution_queue.pop(0)
             if current_node.name not in executed:
-                try:
-                    logger.info(f"Executing node: {current_node.name}")
-                    current_node.execute(self.context)
-                    executed.append(current_node.name)
-
-                    # Add connected nodes to the queue
-                    if current_node.name in self.connections:
-                        execution_queue.extend(self.connections[current_node.name])
-
-                except NodeExecutionError as e:
-                    self.context.add_error(f"Error in node {current_node.name}: {str(e)}")
-                except Exception as e:
-                    self.context.add_error(f"Unexpected error in node {current_node.name}: {str(e)}")
-
-        logger.info("Workflow execution completed")
-        return self.context
\ No newline at end of file
+                with log_context(node=current_node.name):
+                    try:
+                        context.check_deadline()
+                    except ExecutionCancelled as e:
+                        context.add_error(f"Workflow stopped before node {current_node.name}: {str(e)}")
+                        break
+
+                    try:
+                        logger.debug("Executing node")
+                        with context.node_scope(current_node.timeout_seconds):
+                            current_node.execute(context)
+                            # A node that overran its deadline does not feed its successors.
+                            context.check_deadline()
+                        executed.append(current_node.name)
+
+                        # Add connected nodes to the queue
+                        if current_node.name in self.connections:
+                            execution_queue.extend(self.connections[current_node.name])
+
+                    except ExecutionCancelled as e:
+                        context.add_error(f"Node {current_node.name} cancelled: {str(e)}")
+                    except NodeExecutionError as e:
+                        context.add_error(f"Error in node {current_node.name}: {str(e)}")
+                    except Exception as e:
+                        context.add_error(f"Unexpected error in node {current_node.name}: {str(e)}")
+
+        logger.info("Workflow execution completed: %s", self.name)
+        return context
\ No newline at end of file
@@ -1,12 +1,18 @@
+from functools import lru_cache
 from sqlmodel import create_engine, SQLModel, Session
-from app.core.config import settings
+from app.core.config import get_settings
 
-DATABASE_URL = settings.DATABASE_URL
-sync_engine = create_engine(DATABASE_URL, echo=True)
+@lru_cache
+def get_engine():
+    settings = get_settings()
+    connect_args = {}
+    if settings.DATABASE_URL.startswith("sqlite"):
+        connect_args["check_same_thread"] = False
+    return create_engine(settings.DATABASE_URL, echo=settings.SQL_ECHO, connect_args=connect_args)
 
 def create_db_and_tables():
-    SQLModel.metadata.create_all(sync_engine)
+    SQLModel.metadata.create_all(get_engine())
 
 def get_session():
-    with Session(sync_engine) as session:
-        yield session
\ No newline at end of file
+    with Session(get_engine()) as session:
+        yield session
@@ -0,0 +1,47 @@
+"""
+Compare two load-test result files written by loadtest/run.py.
+
+    python -m loadtest.compare BASELINE.json CANDIDATE.json
+"""
+import argparse
+import json
+from pathlib import Path
+
+
+def change(before: float | None, after: float | None) -> str:
+    if not before or after is None:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    for report in (baseline, candidate):
+        git = report.get("git", {})
+        print(f"{report['created_at']}  {report.get('label') or '-':<12} {git.get('commit') or '?'}{' (dirty)' if git.get('dirty') else ''}")
+    print()
+    print(f"{'scenario':<8} {'conc':>5} {'rps':>18} {'p50 ms':>18} {'p99 ms':>18} {'lag p99 ms':>18}")
+
+    for name, stages in candidate["results"].items():
+        before_by_level = {s["concurrency"]: s for s in baseline["results"].get(name, [])}
+        for after in stages:
+            before = before_by_level.get(after["concurrency"])
+            if before is None:
+                continue
+            cells = []
+            for key in ("throughput_rps", "latency_p50_ms", "latency_p99_ms"):
+                cells.append(f"{after[key] or 0:9.1f} {change(before[key], after[key]):>8}")
+            lag_before = before["loop_lag"].get("p99_ms")
+            lag_after = after["loop_lag"].get("p99_ms")
+            cells.append(f"{lag_after or 0:9.1f} {change(lag_before, lag_after):>8}")
+            print(f"{name:<8} {after['concurrency']:>5} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+End-to-end load test of a single API worker.
+
+Starts loadtest/server.py against a throwaway SQLite database, seeds a user
+and a workflow through the public API, then runs each scenario at increasing
+concurrency (closed loop: N clients each send their next request as soon as
+the previous one returns). Reports throughput, p50/p99 latency, errors and the
+server's event-loop lag per stage, and writes everything to
+loadtest/results/<timestamp>[-label].json.
+
+    python -m loadtest.run [--scenarios token,me] [--concurrency 1,8,32] [--duration 10] [--label before]
+    python -m loadtest.compare loadtest/results/a.json loadtest/results/b.json
+
+Run from the backend directory.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+SEED_USER = "loadtest"
+SEED_PASSWORD = "loadtest-password"
+SEED_WORKFLOW = "loadtest-workflow"
+
+
+class Session:
+    """State shared by the scenarios: tokens and ids created during seeding."""
+
+    def __init__(self, token: str, workflow_id: str):
+        self.token = token
+        self.workflow_id = workflow_id
+        self.auth = {"Authorization": f"Bearer {token}"}
+        self._signups = itertools.count()
+
+
+async def signup(client: httpx.AsyncClient, session: Session) -> httpx.Response:
+    name = f"user-{uuid.uuid4().hex[:12]}-{next(session._signups)}"
+    return await client.post("/users/", json={"username": name, "email": f"{name}@example.com", "hashed_password": "pw"})
+
+
+async def token(client: httpx.AsyncClient, session: Session) -> httpx.Response:
+    return await client.post("/token/", data={"username": SEED_USER, "password": SEED_PASSWORD})
+
+
+async def me(client: httpx.AsyncClient, session: Session) -> httpx.Response:
+    return await client.get("/users/me/", headers=session.auth)
+
+
+async def trigger(client: httpx.AsyncClient, session: Session) -> httpx.Response:
+    return await client.post(f"/__loadtest__/workflows/{session.workflow_id}/trigger", headers=session.auth)
+
+
+SCENARIOS = {
+    "signup": signup,
+    "token": token,
+    "me": me,
+    "trigger": trigger,
+}
+
+
+def percentile(ordered: list[float], q: float) -> float | None:
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_stage(client: httpx.AsyncClient, session: Session, scenario, concurrency: int, duration: float) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                response = await scenario(client, session)
+                ok = response.is_success
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            if not ok:
+                errors += 1
+
+    await client.post("/__loadtest__/lag/reset")
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    lag = (await client.get("/__loadtest__/lag")).json()
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": len(latencies) / elapsed,
+        "latency_p50_ms": percentile(latencies, 0.50) * 1000 if latencies else None,
+        "latency_p99_ms": percentile(latencies, 0.99) * 1000 if latencies else None,
+        "loop_lag": lag,
+    }
+
+
+async def seed(client: httpx.AsyncClient) -> Session:
+    response = await client.post(
+        "/users/", json={"username": SEED_USER, "email": f"{SEED_USER}@example.com", "hashed_password": SEED_PASSWORD}
+    )
+    response.raise_for_status()
+    response = await client.post("/token/", data={"username": SEED_USER, "password": SEED_PASSWORD})
+    response.raise_for_status()
+    session = Session(response.json()["access_token"], workflow_id="")
+
+    response = await client.post("/workflows/import/", json=[{"name": SEED_WORKFLOW}], headers=session.auth)
+    response.raise_for_status()
+    response = await client.get("/workflows/export/", headers=session.auth)
+    response.raise_for_status()
+    session.workflow_id = json.loads(response.text.splitlines()[0])["id"]
+    return session
+
+
+async def run_all(base_url: str, scenarios: list[str], levels: list[int], duration: float) -> dict:
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        session = await seed(client)
+        results = {}
+        for name in scenarios:
+            results[name] = []
+            for concurrency in levels:
+                stage = await run_stage(client, session, SCENARIOS[name], concurrency, duration)
+                results[name].append(stage)
+                print(
+                    f"{name:<8} c={concurrency:<4} {stage['throughput_rps']:9.1f} rps  "
+                    f"p50 {stage['latency_p50_ms'] or 0:8.1f} ms  p99 {stage['latency_p99_ms'] or 0:8.1f} ms  "
+                    f"lag p99 {stage['loop_lag'].get('p99_ms', 0):7.1f} ms  errors {stage['errors']}",
+                    flush=True,
+                )
+        return results
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_ready(base_url: str, server: subprocess.Popen, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("Load-test server exited during startup")
+        try:
+            if httpx.get(f"{base_url}/__loadtest__/ready", timeout=1).is_success:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("Load-test server did not become ready")
+
+
+def git_revision() -> dict:
+    def git(*args):
+        out = subprocess.run(["git", *args], cwd=BACKEND_DIR, capture_output=True, text=True)
+        return out.stdout.strip() if out.returncode == 0 else None
+    return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain"))}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"comma separated, from {list(SCENARIOS)}")
+    parser.add_argument("--concurrency", default="1,4,16,64", help="comma separated levels, run in order")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per stage")
+    parser.add_argument("--label", default="", help="suffix for the results file")
+    parser.add_argument("--output", type=Path, help="results file (default: loadtest/results/<timestamp>.json)")
+    args = parser.parse_args()
+
+    scenarios = [s for s in args.scenarios.split(",") if s]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    levels = [int(c) for c in args.concurrency.split(",") if c]
+
+    with tempfile.TemporaryDirectory(prefix="autofluo-loadtest-") as tmp:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{Path(tmp) / 'loadtest.db'}",
+            "SQL_ECHO": "false",
+        }
+        env.setdefault("SECRET_KEY", uuid.uuid4().hex)
+        env.setdefault("ALGORITHM", "HS256")
+        env.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+
+        server = subprocess.Popen(
+            [sys.executable, "-m", "loadtest.server", "--port", str(port)], cwd=BACKEND_DIR, env=env
+        )
+        try:
+            wait_ready(base_url, server)
+            results = asyncio.run(run_all(base_url, scenarios, levels, args.duration))
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+                server.wait()
+
+    started = datetime.now(timezone.utc)
+    report = {
+        "created_at": started.isoformat(),
+        "label": args.label,
+        "git": git_revision(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "database": "sqlite (stand-in)",
+        },
+        "config": {"scenarios": scenarios, "concurrency": levels, "duration_s": args.duration},
+        "results": results,
+    }
+    output = args.output
+    if output is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        suffix = f"-{args.label}" if args.label else ""
+        output = RESULTS_DIR / f"{started.strftime('%Y%m%dT%H%M%SZ')}{suffix}.json"
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
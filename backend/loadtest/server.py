@@ -0,0 +1,102 @@
+"""
+Runs the API for the load-test harness: the normal app plus an event-loop lag
+monitor and a few /__loadtest__ endpoints to read it. Started by
+loadtest/run.py; expects DATABASE_URL etc. in the environment.
+
+    python -m loadtest.server --port 8765
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections import deque
+
+from typing import Annotated
+
+import uvicorn
+from fastapi import Depends
+from sqlalchemy import event
+
+from app.api.dependencies import get_execution_service
+from app.api.v1.executions import get_owned_workflow
+from app.models.execution import StatusEnum
+from app.models.workflow import Workflow
+from app.schemas.execution import ExecutionSummary
+from app.services.execution_service import ExecutionService
+from database import get_engine
+from main import app
+
+LAG_INTERVAL_S = 0.01
+_lag_samples: deque = deque(maxlen=100_000)
+
+
+async def _monitor_lag():
+    """Oversleep of a short sleep is the time the loop spent blocked on something else."""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(LAG_INTERVAL_S)
+        _lag_samples.append(max(0.0, time.perf_counter() - start - LAG_INTERVAL_S))
+
+
+@event.listens_for(get_engine(), "connect")
+def _sqlite_pragmas(dbapi_connection, _):
+    # WAL lets readers proceed during the signup writes; the file DB stands in for Postgres.
+    if get_engine().dialect.name == "sqlite":
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+
+@app.on_event("startup")
+async def start_lag_monitor():
+    app.state.lag_monitor = asyncio.create_task(_monitor_lag())
+
+
+@app.post("/__loadtest__/lag/reset", include_in_schema=False)
+async def reset_lag():
+    _lag_samples.clear()
+    return {"ok": True}
+
+
+@app.get("/__loadtest__/lag", include_in_schema=False)
+async def read_lag():
+    samples = sorted(_lag_samples)
+    if not samples:
+        return {"samples": 0}
+    return {
+        "samples": len(samples),
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p50_ms": samples[len(samples) // 2] * 1000,
+        "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000,
+        "max_ms": samples[-1] * 1000,
+    }
+
+
+# Plain def, like the API routes it stands in for: the sync DB work runs in the threadpool.
+@app.post("/__loadtest__/workflows/{workflow_id}/trigger", response_model=ExecutionSummary, include_in_schema=False)
+def trigger_stand_in(
+    workflow: Annotated[Workflow, Depends(get_owned_workflow)],
+    execution_service: ExecutionService = Depends(get_execution_service),
+):
+    """
+    Stand-in for a manual run until the API can hand runs to the engine: the
+    same auth, ownership check and execution bookkeeping (start, then finish
+    with the rollup update), with no nodes executed in between.
+    """
+    execution = execution_service.start_execution(workflow.id)
+    execution = execution_service.finish_execution(execution.id, StatusEnum.COMPLETED)
+    return ExecutionSummary.model_validate(execution, from_attributes=True)
+
+
+@app.get("/__loadtest__/ready", include_in_schema=False)
+async def ready():
+    return {"ok": True}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", access_log=False)
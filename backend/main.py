@@ -1,6 +1,8 @@
 from fastapi import FastAPI
 from app.api.v1 import auth
 from app.api.v1 import users
+from app.api.v1 import executions
+from app.api.v1 import workflows
 # to get a string like this run:
 # openssl rand -hex 32
 
@@ -17,4 +19,6 @@ def on_startup():
     print("Database and tables created.")
 
 app.include_router(users.router)
-app.include_router(auth.router)
\ No newline at end of file
+app.include_router(auth.router)
+app.include_router(executions.router)
+app.include_router(workflows.router)
\ No newline at end of file
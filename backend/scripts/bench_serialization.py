@@ -0,0 +1,94 @@
+"""
+Encode/decode throughput and size of app/workflow_engine/serialization.py
+against the plain stdlib json used today.
+
+    python scripts/bench_serialization.py [--seconds 0.5]
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app" / "workflow_engine"))
+
+import serialization  # noqa: E402
+from context import ExecutionContext  # noqa: E402
+from schemas import ExecutionResult  # noqa: E402
+
+
+def http_result(i: int, body_items: int) -> dict:
+    body = [
+        {"id": j, "title": f"item {j} of request {i}", "completed": j % 3 == 0, "tags": ["a", "b", "c"]}
+        for j in range(body_items)
+    ]
+    return {"status": 200, "success": True, "raw": json.dumps(body), "body": body}
+
+
+def make_context(nodes: int, body_items: int) -> ExecutionContext:
+    context = ExecutionContext()
+    context.set("trigger", {"trigger_type": "manual", "timestamp": datetime.now().isoformat()})
+    for i in range(nodes):
+        context.set(f"http_{i}", http_result(i, body_items))
+        context.add_history(f"http_{i}")
+    return context
+
+
+def bench(fn, seconds: float) -> float:
+    """Operations per second."""
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        fn()
+        count += 1
+        now = time.perf_counter()
+        if now >= deadline:
+            return count / (now - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=0.5, help="time spent per measurement")
+    args = parser.parse_args()
+
+    payloads = {
+        "small context": make_context(nodes=2, body_items=1),
+        "large context": make_context(nodes=10, body_items=200),
+    }
+    result = ExecutionResult(node_id="http_0", status="COMPLETED", data=http_result(0, 50), execution_time_ms=42)
+
+    variants = [("stdlib json", None, None)]
+    variants.append(("json+auto-zlib", serialization.CODEC_JSON, None))
+    if serialization.msgpack is not None:
+        variants.append(("msgpack", serialization.CODEC_MSGPACK, False))
+        variants.append(("msgpack+auto-zlib", serialization.CODEC_MSGPACK, None))
+    else:
+        print("msgpack not installed; only the JSON codec is measured\n")
+
+    print(f"{'payload':<16} {'codec':<20} {'bytes':>9} {'encode/s':>11} {'decode/s':>11}")
+    cases = [(name, ctx, "context") for name, ctx in payloads.items()] + [("result", result, "result")]
+    for name, obj, kind in cases:
+        for label, codec, compress in variants:
+            if codec is None:
+                data = obj.model_dump() if kind == "result" else {"data": obj.data, "history": obj.history, "errors": obj.errors}
+                blob = json.dumps(data).encode()
+                encode = lambda: json.dumps(data).encode()
+                decode = lambda: json.loads(blob)
+            elif kind == "result":
+                blob = serialization.encode_result(obj, codec=codec, compress=compress)
+                encode = lambda: serialization.encode_result(obj, codec=codec, compress=compress)
+                decode = lambda: serialization.decode_result(blob)
+            else:
+                blob = serialization.encode_context(obj, codec=codec, compress=compress)
+                encode = lambda: serialization.encode_context(obj, codec=codec, compress=compress)
+                decode = lambda: serialization.decode_context(blob)
+            print(
+                f"{name:<16} {label:<20} {len(blob):>9} "
+                f"{bench(encode, args.seconds):>11.0f} {bench(decode, args.seconds):>11.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Cold-import budget check for the API and the workflow engine.
+
+Each target is imported in a fresh interpreter several times, and the best
+time spent in the import statement itself (interpreter start-up is not
+counted) is compared against its budget. The engine is also checked for node
+dependencies that must stay lazy.
+
+    python scripts/check_import_budget.py [--api-ms 1500] [--engine-ms 250]
+
+Exits with status 1 when a budget is exceeded, so it can run in CI.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+ENGINE_DIR = BACKEND_DIR / "app" / "workflow_engine"
+
+# Only imported once a workflow actually uses the node type that needs them.
+# apscheduler is not listed: the scheduler module needs it and is loaded by design.
+ENGINE_LAZY_MODULES = {"yagmail", "jinja2", "requests", "croniter", "pytz"}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "modules": sorted({{m.split(".")[0] for m in sys.modules}})}}))
+"""
+
+
+def measure(statement: str, cwd: Path, runs: int) -> tuple[float, set[str]]:
+    best = float("inf")
+    modules: set[str] = set()
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement)],
+            cwd=cwd, capture_output=True, text=True, check=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        best = min(best, result["ms"])
+        modules = set(result["modules"])
+    return best, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--api-ms", type=float, default=1500.0, help="budget for `import main`")
+    parser.add_argument("--engine-ms", type=float, default=250.0, help="budget for importing the engine")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    failures = []
+
+    api_ms, _ = measure("import main", BACKEND_DIR, args.runs)
+    print(f"api     {api_ms:8.1f} ms  (budget {args.api_ms:.0f} ms)")
+    if api_ms > args.api_ms:
+        failures.append(f"API cold import took {api_ms:.1f} ms, budget is {args.api_ms:.0f} ms")
+
+    engine_ms, modules = measure(
+        "import workflow_engine, nodes.registry, schemas", ENGINE_DIR, args.runs
+    )
+    print(f"engine  {engine_ms:8.1f} ms  (budget {args.engine_ms:.0f} ms)")
+    if engine_ms > args.engine_ms:
+        failures.append(f"Engine cold import took {engine_ms:.1f} ms, budget is {args.engine_ms:.0f} ms")
+    eager = ENGINE_LAZY_MODULES & modules
+    if eager:
+        failures.append(f"Engine import eagerly loaded: {', '.join(sorted(eager))}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())